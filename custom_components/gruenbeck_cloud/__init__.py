@@ -51,6 +51,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator: GruenbeckCloudCoordinator = hass.data[DOMAIN][entry.entry_id]
 
         if isinstance(coordinator, GruenbeckCloudCoordinator):
+            # Cancel any pending debounced parameter flush
+            coordinator.cancel_pending_params()
             # Disconnect open connections
             await coordinator.disconnect()
             if coordinator.unsub:
@@ -15,6 +15,14 @@ CONF_DEVICE_ID: Final = "device_id"
 # Polling update interval
 UPDATE_INTERVAL: Final = timedelta(seconds=360)
 
+# Debounce window in seconds to coalesce rapid setting changes
+# into a single parameter update request
+PARAMETER_UPDATE_DEBOUNCE: Final = 0.1
+
+# Delay bounds in seconds before reconnecting a dropped WebSocket
+WS_RECONNECT_MIN_DELAY: Final = 5.0
+WS_RECONNECT_MAX_DELAY: Final = 300.0
+
 # Custom Unit of Measurement
 UNIT_OF_DH: Final = "°dH"
 UNIT_OF_MA_MIN: Final = "mAmin"
@@ -32,6 +40,7 @@ SERVICE_UPDATE_DEVICE_PARAMETERS_SCHEMA = vol.Schema(
         vol.Required(SERVICE_PARAM_VALUE): vol.Any(str, int),
     }
 )
+SERVICE_GET_MEASUREMENTS: Final = "get_device_measurements"
 SERVICE_GET_SALT_MEASUREMENTS: Final = "get_device_salt_measurements"
 SERVICE_GET_WATER_MEASUREMENTS: Final = "get_device_water_measurements"
 SERVICE_REGENERATE: Final = "regenerate"
@@ -1,7 +1,11 @@
 """Coordinator for Grünbeck Cloud integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from collections.abc import Callable
+from operator import attrgetter
 from typing import Any
 
 import aiohttp
@@ -9,7 +13,9 @@ from yarl import URL
 from pygruenbeck_cloud import PyGruenbeckCloud
 from pygruenbeck_cloud.exceptions import (
     PyGruenbeckCloudConnectionClosedError,
+    PyGruenbeckCloudConnectionError,
     PyGruenbeckCloudError,
+    PyGruenbeckCloudResponseError,
     PyGruenbeckCloudResponseStatusError,
     PyGruenbeckCloudUpdateParameterError,
 )
@@ -29,17 +35,26 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_DEVICE_ID,
     DOMAIN,
+    PARAMETER_UPDATE_DEBOUNCE,
     SERVICE_PARAM_PARAMETER,
     SERVICE_PARAM_VALUE,
     UPDATE_INTERVAL,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RECONNECT_MIN_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Placeholders which can occur in refresh_sd header templates
+_PLACEHOLDER_PATTERN = re.compile(
+    rf"\{{({re.escape(PARAM_NAME_ACCESS_TOKEN)}|{re.escape(PARAM_NAME_DEVICE_ID)})\}}"
+)
+
 
 class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
     """Grünbeck Cloud Coordinator."""
@@ -60,12 +75,86 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
         self.api.logger = _LOGGER
         self._device_id = config_entry.data[CONF_DEVICE_ID]
 
+        # Number of consecutive failed polls, used to pause polling
+        # instead of hammering a broken endpoint at full rate
+        self._failed_polls: int = 0
+
+        # Backoff delay before the next websocket reconnect attempt
+        self._ws_reconnect_delay: float = WS_RECONNECT_MIN_DELAY
+
+        # Buffered parameter changes waiting to be sent as one request
+        self._pending_params: dict[str, Any] = {}
+        self._flush_params_handle: asyncio.TimerHandle | None = None
+
+        # Snapshot of the realtime telemetry dispatched to listeners
+        # last, used to detect unchanged websocket frames
+        self._dispatched_realtime: dict[str, Any] | None = None
+
+        # All parts of the refresh_sd request except the bearer token are
+        # constant for the lifetime of the coordinator, precompute them
+        config = WEB_REQUESTS["refresh_sd"]
+        self._refresh_sd_url = URL.build(
+            scheme=config["scheme"],
+            host=config["host"],
+            port=config["port"],
+            path=self.api._placeholder_to_values_str(
+                config["path"],
+                {PARAM_NAME_DEVICE_ID: self._device_id},
+            ),
+            query=config["query_params"],
+        )
+        self._refresh_sd_method = config["method"]
+        self._refresh_sd_data = config["data"]
+
+        # Split headers into static ones and templates which still need
+        # placeholder substitution, so only the latter are touched per call
+        self._refresh_sd_static_headers: dict[str, str] = {}
+        self._refresh_sd_header_templates: list[tuple[str, str]] = []
+        for key, value in config["headers"].items():
+            if _PLACEHOLDER_PATTERN.search(value):
+                self._refresh_sd_header_templates.append((key, value))
+            else:
+                self._refresh_sd_static_headers[key] = value
+
         self.unsub: CALLBACK_TYPE | None = None
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=UPDATE_INTERVAL)
+        # always_update=False: Device is a dataclass with a generated
+        # __eq__, so unchanged payloads skip the listener dispatch
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+            always_update=False,
+        )
 
     async def disconnect(self) -> None:
         """Disconnect from API."""
         await self.api.disconnect()
+        # The library's disconnect() early-returns without closing its
+        # websocket session when it is no longer connected, and connect()
+        # only creates a new session when none is set - close and reset
+        # it so reconnects neither leak a session nor hit a closed one
+        if self.api._ws_session is not None and not self.api._ws_session.closed:
+            await self.api._ws_session.close()
+        self.api._ws_session = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, disconnect websocket when unused."""
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        @callback
+        def remove_listener_and_disconnect() -> None:
+            """Remove listener, close websocket with the last one."""
+            remove_listener()
+            if not self._listeners:
+                self.config_entry.async_create_task(
+                    self.hass, self.disconnect(), "gruenbeck-cloud-disconnect"
+                )
+
+        return remove_listener_and_disconnect
 
     @callback
     def _listen_websocket(self) -> None:
@@ -75,7 +164,11 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
             """Listen for state changes."""
             try:
                 await self.api.connect()
-            except (PyGruenbeckCloudError, PyGruenbeckCloudResponseStatusError) as err:
+            except (
+                PyGruenbeckCloudConnectionError,
+                PyGruenbeckCloudError,
+                PyGruenbeckCloudResponseStatusError,
+            ) as err:
                 self.logger.error(err)
                 if self.unsub:
                     self.unsub()
@@ -84,6 +177,30 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
 
             try:
                 await self.api.listen(callback=self.async_set_updated_data)
+            except PyGruenbeckCloudConnectionError as err:
+                # A missed heartbeat pong surfaces as an error frame and
+                # is raised by listen() as a connection error - reconnect
+                # right away instead of waiting for the next poll
+                self.last_update_success = False
+                self.logger.debug(
+                    "WebSocket connection lost, reconnecting: %s", err
+                )
+                if self.unsub:
+                    self.unsub()
+                    self.unsub = None
+                await self.disconnect()
+
+                # Reconnect with capped backoff so a connection which
+                # drops right after connecting does not hammer the
+                # cloud API with token negotiations
+                delay = self._ws_reconnect_delay
+                self._ws_reconnect_delay = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+                await asyncio.sleep(delay)
+                if self.api.connected or self.unsub:
+                    # A poll restarted the listener in the meantime
+                    return
+                self._listen_websocket()
+                return
             except (
                 PyGruenbeckCloudConnectionClosedError,
                 PyGruenbeckCloudResponseStatusError,
@@ -96,15 +213,21 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
                 self.logger.error(err)
 
             # Ensure we disconnect
-            await self.api.disconnect()
+            await self.disconnect()
             if self.unsub:
                 self.unsub()
                 self.unsub = None
 
         async def close_websocket(_: Event) -> None:
             """Close WebSocket connection."""
+            # Unset first so a second shutdown signal is a no-op
             self.unsub = None
-            await self.api.disconnect()
+            try:
+                # Don't block time-critical Home Assistant shutdown on
+                # a stuck socket
+                await asyncio.wait_for(self.api.disconnect(), timeout=5.0)
+            except TimeoutError:
+                self.logger.debug("WebSocket close timed out during shutdown")
 
         # Clean disconnect WebSocket on Home Assistant shutdown
         self.unsub = self.hass.bus.async_listen_once(
@@ -116,40 +239,53 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
             self.hass, listen(), "gruenbeck-cloud-listen"
         )
 
+    @staticmethod
+    def _measurement_entries(measurements: list[Any] | None) -> list[dict[str, Any]]:
+        """Convert measurements into service response entries."""
+        if measurements is None:
+            return []
+
+        # Extract both columns with attrgetter before zipping them back
+        # into entries, cheaper than per-row attribute lookups on
+        # long histories
+        dates = map(attrgetter("date"), measurements)
+        values = map(attrgetter("value"), measurements)
+        return [
+            {
+                "date": date,
+                "value": value,
+            }
+            for date, value in zip(dates, values)
+        ]
+
     async def service_get_device_salt_measurements(
         self, call: ServiceCall
     ) -> ServiceResponse:
         """Service to get Salt measurements."""
         device = await self.api.get_device_salt_measurements()
-        if device.salt is None:
-            return {"entries": []}
 
-        return {
-            "entries": [
-                {
-                    "date": item.date,
-                    "value": item.value,
-                }
-                for item in device.salt
-            ],
-        }
+        return {"entries": self._measurement_entries(device.salt)}
 
     async def service_get_device_water_measurements(
         self, call: ServiceCall
     ) -> ServiceResponse:
         """Service to get Water measurements."""
         device = await self.api.get_device_water_measurements()
-        if device.water is None:
-            return {"entries": []}
+
+        return {"entries": self._measurement_entries(device.water)}
+
+    async def service_get_device_measurements(
+        self, call: ServiceCall
+    ) -> ServiceResponse:
+        """Service to get Salt and Water measurements in one call."""
+        salt_device, water_device = await asyncio.gather(
+            self.api.get_device_salt_measurements(),
+            self.api.get_device_water_measurements(),
+        )
 
         return {
-            "entries": [
-                {
-                    "date": item.date,
-                    "value": item.value,
-                }
-                for item in device.water
-            ],
+            "salt": self._measurement_entries(salt_device.salt),
+            "water": self._measurement_entries(water_device.water),
         }
 
     async def service_regenerate(self, call: ServiceCall) -> None:
@@ -158,11 +294,48 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
 
     async def service_change_settings(self, call: ServiceCall) -> None:
         """Service for update device settings."""
-        data = {
-            call.data[SERVICE_PARAM_PARAMETER]: call.data[SERVICE_PARAM_VALUE],
-        }
+        self._pending_params[call.data[SERVICE_PARAM_PARAMETER]] = call.data[
+            SERVICE_PARAM_VALUE
+        ]
+
+        # Coalesce rapid consecutive changes into a single request
+        if self._flush_params_handle is not None:
+            self._flush_params_handle.cancel()
+        self._flush_params_handle = self.hass.loop.call_later(
+            PARAMETER_UPDATE_DEBOUNCE,
+            lambda: self.hass.async_create_task(self._flush_params()),
+        )
+
+    async def _flush_params(self) -> None:
+        """Send all buffered parameter changes in one request."""
+        self._flush_params_handle = None
+        data, self._pending_params = self._pending_params, {}
+        if not data:
+            return
+
+        try:
+            await self.update_device_infos_parameters(data)
+        except (
+            # ValueError: the library parses time parameters with
+            # datetime.strptime, which raises on malformed user input
+            ValueError,
+            HomeAssistantError,
+            PyGruenbeckCloudConnectionClosedError,
+            PyGruenbeckCloudConnectionError,
+            PyGruenbeckCloudError,
+            PyGruenbeckCloudResponseError,
+            PyGruenbeckCloudResponseStatusError,
+        ) as err:
+            # We run as background task, there is no caller to propagate to
+            self.logger.error("Unable to update device settings: %s", err)
 
-        await self.update_device_infos_parameters(data)
+    @callback
+    def cancel_pending_params(self) -> None:
+        """Cancel a pending debounced parameter flush."""
+        if self._flush_params_handle is not None:
+            self._flush_params_handle.cancel()
+            self._flush_params_handle = None
+        self._pending_params.clear()
 
     async def update_device_infos_parameters(self, data: dict[str, Any]) -> None:
         """Update Device parameters."""
@@ -174,21 +347,47 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
     @callback
     def async_set_updated_data(self, data: Device) -> None:
         """Manually update data from WebSocket, avoid stopping refresh interval."""
-        self.data = data
         self.last_update_success = True
-
-        self.logger.debug(
-            "Manually updated %s data",
-            self.name,
+        self._reset_poll_backoff()
+        # Frames are flowing again, start future reconnects fast
+        self._ws_reconnect_delay = WS_RECONNECT_MIN_DELAY
+
+        # The library updates its Device in place and passes us that
+        # same object, so comparing data against self.data can never
+        # detect a change. Compare the telemetry against a snapshot
+        # taken at the last dispatch instead.
+        realtime = (
+            # to_dict is generated by @dataclass_json, invisible to mypy
+            data.realtime.to_dict()  # type: ignore[attr-defined]
+            if data.realtime is not None
+            else None
         )
+        if data is self.data and realtime == self._dispatched_realtime:
+            # Frame delivered unchanged telemetry, skip redrawing entities
+            return
+
+        self._dispatched_realtime = realtime
+        self.data = data
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Manually updated %s data",
+                self.name,
+            )
         self.async_update_listeners()
 
     async def _async_update_data(self) -> Device:
         """Update regularly data from API."""
-        self.logger.debug(
-            "Regularly updated %s data",
-            self.name,
-        )
+        # No entity is subscribed, skip the API requests (and starting
+        # the websocket) until a listener returns
+        if not self._listeners and self.data is not None:
+            return self.data
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Regularly updated %s data",
+                self.name,
+            )
 
         try:
             if not self.api.device:
@@ -199,54 +398,110 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
             # Start listening to websocket at first time
             if not self.api.connected and not self.unsub:
                 self._listen_websocket()
+            elif self.api.connected:
+                # WebSocket already pushes realtime data through
+                # async_set_updated_data, no extra REST request needed
+                self._reset_poll_backoff()
+                return device
             else:
                 await self.api.enter_sd()
-                #await self.api.refresh_sd()
                 device.realtime = await self.refresh_sd()
 
-            self.logger.debug("=== real time data ===")
-            self.logger.debug(self.api.device)
+            # Guarded because rendering the full Device repr is expensive
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("=== real time data ===\n%r", self.api.device)
+            self._reset_poll_backoff()
             return device
         except (
-            Exception,
+            aiohttp.ClientError,
+            TimeoutError,
             IndexError,
             KeyError,
+            PyGruenbeckCloudConnectionClosedError,
+            PyGruenbeckCloudConnectionError,
+            PyGruenbeckCloudError,
+            PyGruenbeckCloudResponseError,
             PyGruenbeckCloudResponseStatusError,
         ) as err:
+            self._failed_polls += 1
+            if self._failed_polls >= 2:
+                # Back off to a longer interval after repeated failures,
+                # the scheduler keeps running so polling recovers on its
+                # own once the cloud is reachable again
+                self.update_interval = UPDATE_INTERVAL * min(self._failed_polls, 10)
             raise UpdateFailed(f"Unable to get data from API: {err}") from err
 
+    @callback
+    def _reset_poll_backoff(self) -> None:
+        """Restore the regular polling interval after a successful update."""
+        self._failed_polls = 0
+        if self.update_interval != UPDATE_INTERVAL:
+            self.update_interval = UPDATE_INTERVAL
+            self._schedule_refresh()
+
+    def _refresh_sd_build_headers(self, token: str) -> dict[str, str]:
+        """Build refresh_sd headers with the placeholders substituted."""
+        values = {
+            PARAM_NAME_ACCESS_TOKEN: token,
+            PARAM_NAME_DEVICE_ID: self._device_id,
+        }
+        headers = dict(self._refresh_sd_static_headers)
+        for key, template in self._refresh_sd_header_templates:
+            headers[key] = _PLACEHOLDER_PATTERN.sub(
+                lambda match: values[match.group(1)], template
+            )
+
+        return headers
+
+    async def _refresh_sd_request(
+        self, headers: dict[str, str], retry_auth: bool = True
+    ) -> Any:
+        """Execute refresh_sd request on the shared session.
+
+        Decodes the response body with Home Assistant's orjson-backed
+        json_loads instead of the slower stdlib decoder. Unlike requests
+        going through the library's _http_request helper, these do not
+        show up in the response log included in diagnostics.
+        """
+        session = self.api.session
+        if session is None:
+            session = self.api.session = async_get_clientsession(self.hass)
+
+        async with session.request(
+            self._refresh_sd_method,
+            self._refresh_sd_url,
+            headers=headers,
+            data=self._refresh_sd_data,
+        ) as response:
+            if (
+                retry_auth
+                and response.status == aiohttp.http.HTTPStatus.UNAUTHORIZED
+            ):
+                # Token was revoked before its expiry - invalidate the
+                # library's cached auth token so we really get a fresh
+                # one, and retry once
+                self.api._auth_token = None
+                token = await self.api._get_web_access_token()
+                return await self._refresh_sd_request(
+                    self._refresh_sd_build_headers(token), retry_auth=False
+                )
+
+            if response.status not in (
+                aiohttp.http.HTTPStatus.ACCEPTED,
+                aiohttp.http.HTTPStatus.OK,
+            ):
+                raise PyGruenbeckCloudResponseStatusError(
+                    f"Response status code is {response.status}"
+                )
+
+            return json_loads(await response.read())
+
     async def refresh_sd(self) -> DeviceRealtimeInfo:
 
+        # The library caches its auth token and refreshes it on its own
+        # shortly before expiry, no extra caching needed here
         token = await self.api._get_web_access_token()
-
-        scheme = WEB_REQUESTS["refresh_sd"]["scheme"]
-        host = WEB_REQUESTS["refresh_sd"]["host"]
-        port = WEB_REQUESTS["refresh_sd"]["port"]
-        use_cookies = WEB_REQUESTS["refresh_sd"]["use_cookies"]
-
-        headers = self.api._placeholder_to_values_dict(
-            WEB_REQUESTS["refresh_sd"]["headers"],
-            {
-                PARAM_NAME_ACCESS_TOKEN: token,
-            },
-        )
-        path = self.api._placeholder_to_values_str(
-            WEB_REQUESTS["refresh_sd"]["path"],
-            {PARAM_NAME_DEVICE_ID: self._device_id},
-        )
-        method = WEB_REQUESTS["refresh_sd"]["method"]
-        data = WEB_REQUESTS["refresh_sd"]["data"]
-        query = WEB_REQUESTS["refresh_sd"]["query_params"]
-
-        url = URL.build(scheme=scheme, host=host, port=port, path=path, query=query)
-        # @TODO - expected_status_codes and allow_redirects can also come from CONST!
-        response = await self.api._http_request(
-            url=url,
-            headers=headers,
-            method=method,
-            data=data,
-            expected_status_codes=[aiohttp.http.HTTPStatus.ACCEPTED, aiohttp.http.HTTPStatus.OK],
-            use_cookies=use_cookies,
-        )
+        headers = self._refresh_sd_build_headers(token)
+        response = await self._refresh_sd_request(headers)
 
         return DeviceRealtimeInfo.from_dict(response)
\ No newline at end of file
@@ -6,6 +6,7 @@ from homeassistant.core import HomeAssistant, SupportsResponse, callback
 
 from .const import (
     DOMAIN,
+    SERVICE_GET_MEASUREMENTS,
     SERVICE_GET_SALT_MEASUREMENTS,
     SERVICE_GET_WATER_MEASUREMENTS,
     SERVICE_REGENERATE,
@@ -49,3 +50,10 @@ def register_services(
         coordinator.service_get_device_water_measurements,
         supports_response=SupportsResponse.ONLY,
     )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MEASUREMENTS,
+        coordinator.service_get_device_measurements,
+        supports_response=SupportsResponse.ONLY,
+    )